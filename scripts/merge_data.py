@@ -1,87 +1,190 @@
 import json
 import gzip
+import argparse
+import io
+import pickle
+import re
+from itertools import chain
 from pathlib import Path
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def merge_job_data():
-    """Merge new scrape with existing data, removing stale jobs."""
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
-    # Load new scraped data
-    new_path = Path("scripts/output/all_jobs.json.gz")
-    with gzip.open(new_path, "rt", encoding="utf-8") as f:
-        new_jobs = json.load(f)
-    print(f"New scrape: {len(new_jobs):,} jobs")
+# Parsed copy of the last merge output, reused while data/all_jobs.json.gz
+# is unchanged. Only used with --cache, for repeated local runs: a fresh CI
+# checkout never has it, and writing it costs seconds on every merge.
+CACHE_PATH = Path("data/.cache/all_jobs.pkl")
 
-    # Load existing data (if exists)
-    existing_jobs = []
-    existing_path = Path("data/all_jobs.json.gz")
-    if existing_path.exists():
-        with gzip.open(existing_path, "rt", encoding="utf-8") as f:
-            existing_jobs = json.load(f)
-        print(f"Existing data: {len(existing_jobs):,} jobs")
-
-    # Merge by URL
-    merged = {}
-    stale_count = 0
-
-    # Add existing jobs first (with age filter)
-    for job in existing_jobs:
-        url = job.get("absolute_url") or job.get("url")
-        if not url:
-            continue
+# scraped_at values that can be compared against the cutoff as strings
+ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def load_json(data):
+    """Decode JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
-        # Keep jobs scraped within last 30 days
+
+def dump_json(obj, indent=False):
+    """Encode an object to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def iter_jobs(path):
+    """Yield jobs one at a time from a gzipped JSON array."""
+    with gzip.open(path, "rb") as f:
+        if ijson is not None:
+            yield from ijson.items(f, "item", use_float=True)
+        else:
+            yield from load_json(f.read())
+
+
+def file_key(path):
+    """Identify a file version by its modification time and size."""
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def load_cached_jobs(path):
+    """Return the jobs cached for `path`, or None if it changed since."""
+    try:
+        with open(CACHE_PATH, "rb") as f:
+            # The key is pickled separately so a stale cache is rejected
+            # without unpickling the jobs
+            if pickle.load(f) != file_key(path):
+                return None
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+
+def save_cached_jobs(path, jobs):
+    """Cache parsed jobs for the current version of `path`."""
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(CACHE_PATH, "wb") as f:
+        pickle.dump(file_key(path), f, protocol=5)
+        pickle.dump(jobs, f, protocol=5)
+
+
+def write_jobs(path, jobs):
+    """Stream jobs into a gzipped JSON array, one encoded job at a time."""
+    with gzip.open(path, "wb", compresslevel=1) as gz:
+        # Buffer the many small writes into large chunks for gzip
+        with io.BufferedWriter(gz, 1 << 20) as f:
+            f.write(b"[")
+            for i, job in enumerate(jobs):
+                if i:
+                    f.write(b",")
+                f.write(dump_json(job))
+            f.write(b"]")
+
+
+def count_jobs(jobs, counts, key):
+    """Pass jobs through unchanged, tallying them under counts[key]."""
+    for job in jobs:
+        counts[key] += 1
+        yield job
+
+
+def fresh_jobs(jobs, cutoff, counts):
+    """Yield jobs scraped on or after the `cutoff` date (YYYY-MM-DD).
+
+    Jobs without an ISO-8601 scraped_at (missing, or malformed like
+    "1/2/2026" or 123) are kept.
+    """
+    for job in jobs:
         scraped = job.get("scraped_at")
-        if scraped:
-            try:
-                scraped_date = datetime.fromisoformat(scraped.replace("Z", ""))
-                now = datetime.now(timezone.utc)
-                age_days = (now - scraped_date).days
-
-                if age_days <= 30:
-                    merged[url] = job
-                else:
-                    stale_count += 1
-            except Exception:
-                # If date parsing fails, keep the job
-                merged[url] = job
+        if isinstance(scraped, str) and ISO_DATE_RE.match(scraped) and scraped < cutoff:
+            counts["stale"] += 1
+            continue
+        yield job
+
+
+def merge_job_data(use_cache=False):
+    """Merge new scrape with existing data, removing stale jobs.
+
+    With `use_cache`, the parsed merge output is cached for the next run.
+    """
+
+    counts = {"existing": 0, "stale": 0, "new": 0}
+
+    # ISO-8601 timestamps sort lexically, so compare strings instead of
+    # parsing every scraped_at into a datetime. A bare date is a prefix of
+    # every timestamp on that day, so it compares below all of them and
+    # needs no per-job trimming of "Z"/offset suffixes.
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=30)).date().isoformat()
+
+    # Stream existing data first (if exists), keeping jobs from the last 30 days
+    existing_jobs = ()
+    existing_path = Path("data/all_jobs.json.gz")
+    if existing_path.exists():
+        jobs = load_cached_jobs(existing_path) if use_cache else None
+        if jobs is None:
+            jobs = iter_jobs(existing_path)
         else:
-            # No scraped_at field, keep it
-            merged[url] = job
+            print(f"Reusing cached parse of {existing_path}")
+        existing_jobs = fresh_jobs(count_jobs(jobs, counts, "existing"), cutoff, counts)
 
-    if stale_count > 0:
-        print(f"Dropped {stale_count:,} stale jobs (>30 days old)")
+    new_jobs = count_jobs(
+        iter_jobs(Path("scripts/output/all_jobs.json.gz")), counts, "new"
+    )
 
-    # Add/update with new scrape (always wins on duplicates)
-    for job in new_jobs:
-        url = job.get("absolute_url") or job.get("url")
-        if url:
-            merged[url] = job
+    # Merge by URL in a single pass; new scrape comes second so it always
+    # wins on duplicates
+    merged = {
+        url: job
+        for job in chain(existing_jobs, new_jobs)
+        if (url := job.get("absolute_url") or job.get("url"))
+    }
+
+    if existing_path.exists():
+        print(f"Existing data: {counts['existing']:,} jobs")
+    if counts["stale"] > 0:
+        print(f"Dropped {counts['stale']:,} stale jobs (>30 days old)")
+    print(f"New scrape: {counts['new']:,} jobs")
 
-    # Convert to list
-    final_jobs = list(merged.values())
-    print(f"Merged result: {len(final_jobs):,} jobs")
+    total_jobs = len(merged)
+    print(f"Merged result: {total_jobs:,} jobs")
 
     # Ensure data directory exists
     Path("data").mkdir(exist_ok=True)
 
     # Save merged data
-    with gzip.open("data/all_jobs.json.gz", "wt", encoding="utf-8") as f:
-        json.dump(final_jobs, f)
+    write_jobs(existing_path, merged.values())
+    if use_cache:
+        save_cached_jobs(existing_path, list(merged.values()))
 
     # Update metadata
-    with open("scripts/output/metadata.json", "r") as f:
-        metadata = json.load(f)
+    with open("scripts/output/metadata.json", "rb") as f:
+        metadata = load_json(f.read())
 
-    metadata["total_jobs"] = len(final_jobs)
+    metadata["total_jobs"] = total_jobs
 
-    with open("data/metadata.json", "w") as f:
-        json.dump(metadata, f, indent=2)
+    with open("data/metadata.json", "wb") as f:
+        f.write(dump_json(metadata, indent=True))
 
     print("Merge complete")
-    return len(final_jobs)
+    return total_jobs
 
 
 if __name__ == "__main__":
-    merge_job_data()
+    parser = argparse.ArgumentParser(description="Merge scraped jobs into data/")
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache the parsed merge output for faster repeated local runs",
+    )
+    args = parser.parse_args()
+
+    merge_job_data(use_cache=args.cache)
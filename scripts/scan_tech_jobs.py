@@ -1,5 +1,11 @@
 import json
 import re
+from functools import lru_cache
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # ============================================================
 # CONFIG
@@ -63,6 +69,68 @@ SENIOR_KEYWORDS = [
     '5',    # Software Engineer 5
 ]
 
+# Keywords up to this long (numerals, digits, 'jr', 'sr', 'vp', ...) only
+# match as whole words; longer ones are stems that match at the start of a
+# word with any suffix ('intern' -> 'internship')
+WHOLE_WORD_MAX_LEN = 3
+
+def is_whole_word(keyword):
+    return len(keyword) <= WHOLE_WORD_MAX_LEN
+
+def compile_keywords(keywords):
+    """Compile keywords into one regex over lowercased text."""
+    # Longest first so 'jr.' wins over 'jr'; lookarounds instead of \b so
+    # keywords ending in punctuation still match. Word characters are
+    # letters and digits only: titles like 'IN_Senior Associate_SAP' use
+    # underscores as separators
+    ordered = sorted(keywords, key=len, reverse=True)
+    words = '|'.join(re.escape(k) for k in ordered if is_whole_word(k))
+    stems = '|'.join(re.escape(k) for k in ordered if not is_whole_word(k))
+    alternatives = []
+    if words:
+        alternatives.append(r'(?:' + words + r')(?![^\W_])')
+    if stems:
+        alternatives.append(r'(?:' + stems + r')')
+    return re.compile(r'(?<![^\W_])(?:' + '|'.join(alternatives) + r')')
+
+def _is_word_char(char):
+    return char.isalnum()
+
+def build_matcher(keywords):
+    """Return a function checking if text contains any keyword.
+    
+    Every keyword has to start a word; short ones must also end it (see
+    WHOLE_WORD_MAX_LEN).
+    
+    Uses an Aho-Corasick automaton (pyahocorasick) when installed, so each
+    string is scanned once for every keyword; otherwise a compiled regex.
+    The returned function expects already-lowercased text.
+    """
+    if ahocorasick is None:
+        regex = compile_keywords(keywords)
+        return lambda text: regex.search(text) is not None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, (len(keyword), is_whole_word(keyword)))
+    automaton.make_automaton()
+    
+    def matches(text):
+        for end, (length, whole_word) in automaton.iter(text):
+            start = end - length + 1
+            if start > 0 and _is_word_char(text[start - 1]):
+                continue
+            if whole_word and end + 1 < len(text) and _is_word_char(text[end + 1]):
+                continue
+            return True
+        return False
+    
+    return matches
+
+matches_remote = build_matcher(REMOTE_KEYWORDS)
+matches_junior = build_matcher(JUNIOR_KEYWORDS)
+matches_senior = build_matcher(SENIOR_KEYWORDS)
+
 # ============================================================
 # FILTER FUNCTIONS
 # ============================================================
@@ -72,40 +140,37 @@ def is_remote(location):
     if not location:
         return False
     
-    location_lower = location.lower()
-    return any(keyword in location_lower for keyword in REMOTE_KEYWORDS)
+    return matches_remote(location.lower())
 
 def is_junior(title):
     """Check if title indicates junior/entry level position."""
     if not title:
         return False
     
+    # Lowercase once for both keyword scans
     title_lower = title.lower()
     
     # First, exclude senior positions
-    if any(keyword in title_lower for keyword in SENIOR_KEYWORDS):
+    if matches_senior(title_lower):
         return False
     
-    # Check for junior indicators
-    # Special handling for numbered positions (e.g., "Software Engineer I" or "Engineer 1")
-    if re.search(r'\b(i|1)\b', title_lower):
-        return True
-    
-    # Check other junior keywords
-    return any(keyword in title_lower for keyword in JUNIOR_KEYWORDS)
+    # Check for junior indicators, including numbered positions
+    # (e.g., "Software Engineer I" or "Engineer 1")
+    return matches_junior(title_lower)
 
 def filter_jobs(jobs):
     """Filter jobs for remote + junior positions."""
-    filtered = []
-    
-    for job in jobs:
-        title = job.get('title', '')
-        location = job.get('location', '')
-        
-        if is_remote(location) and is_junior(title):
-            filtered.append(job)
+    # The location column is highly repetitive (~50k distinct values across
+    # ~360k jobs), so evaluate it once per distinct value
+    is_remote_location = lru_cache(maxsize=None)(is_remote)
     
-    return filtered
+    # Location check first: it is a single scan of a short string, and
+    # only ~10% of jobs pass it and go on to the two title scans
+    return [
+        job for job in jobs
+        if is_remote_location(job.get('location', ''))
+        and is_junior(job.get('title', ''))
+    ]
 
 # ============================================================
 # MAIN
@@ -1,14 +1,47 @@
-import requests
+import aiohttp
+import asyncio
 import json
 import random
-import time
 import re
 import os
 import gzip
 import argparse
-from datetime import datetime, timezone
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from collections import defaultdict
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from itertools import chain, zip_longest
+from typing import Any, Optional, TypedDict
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
 
 # ============================================================
 # CONFIGURATION
@@ -24,9 +57,23 @@ LEVER_FILE = os.path.join(ROOT_DIR, "data", "lever_companies.json")
 
 ICIMS_FILE = os.path.join(ROOT_DIR, "data", "icims_companies.json")
 
+# Per-platform streaks of runs in which a company's board was gone (404/403)
+# or answered with no jobs, stored as the dates of the first and latest miss
+# and a miss count capped at DEAD_AFTER_RUNS, so the file only changes when
+# a company is actually fetched. Past DEAD_AFTER_RUNS the company is skipped
+# until DEAD_RECHECK_DAYS have passed since it was last checked
+DEAD_SLUGS_FILE = os.path.join(ROOT_DIR, "data", "dead_slugs.json")
+DEAD_AFTER_RUNS = 3
+DEAD_RECHECK_DAYS = 7
+DEAD_STATUSES = {403, 404}
+
 OUTPUT_DIR = os.path.join(SCRIPT_DIR, "output")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+# Raw GET responses with their ETag/Last-Modified, kept between runs so
+# unchanged boards can be revalidated with a conditional request
+CACHE_DIR = os.path.join(ROOT_DIR, "data", "cache")
+
 RECRUITER_TERMS = [
     "recruit",
     "recruiting",
@@ -43,6 +90,16 @@ RECRUITER_TERMS = [
     "resources",
     "agency",
 ]
+# Terms that contain a shorter term (e.g. "recruiter") can never change a
+# search result, so only the minimal ones go into the pattern
+RECRUITER_RE = re.compile(
+    "|".join(
+        re.escape(term)
+        for term in RECRUITER_TERMS
+        if not any(other != term and other in term for other in RECRUITER_TERMS)
+    ),
+    re.IGNORECASE,
+)
 
 USER_AGENTS = [
     # Chrome 144 - Windows
@@ -63,6 +120,46 @@ USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36 Edg/144.0.0.0",
 ]
 
+# Connection pool limits for the shared aiohttp session
+MAX_CONNECTIONS = 100
+MAX_CONNECTIONS_PER_HOST = 4
+DNS_CACHE_TTL = 300
+# Idle pooled connections stay open this long (aiohttp's default is 15s),
+# so a host's connections survive the gaps between its companies and
+# between Workday pages instead of paying for a new TLS handshake
+KEEPALIVE_TIMEOUT = 30
+
+# Greenhouse, Ashby and Lever serve every company from one host, so those
+# hosts get a slightly larger (but still polite) share of concurrent
+# requests. BambooHR and Workday use a host per company.
+SHARED_HOST_CONCURRENCY = 6
+SHARED_HOSTS = {"boards-api.greenhouse.io", "jobs.ashbyhq.com", "api.lever.co"}
+HOST_SEMAPHORES = {}
+
+# Companies fetched at once (one worker each); the rest wait their turn
+# instead of all queueing inside the connection pool
+MAX_CONCURRENT_FETCHES = 100
+
+# Per-socket connect/read timeouts. A total timeout would also count the
+# time a request spends queued for a free pooled connection.
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=15)
+
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Bodies shorter than this can't hold a job posting (an empty Greenhouse
+# board is '{"jobs":[],"meta":{"total":0}}'), so they are not decoded
+EMPTY_BODY_BYTES = 64
+
+# Progress lines are buffered and written once per this many companies, or
+# after this many seconds so a slow tail of companies still shows progress
+PROGRESS_BATCH = 100
+PROGRESS_INTERVAL = 2.0
+
+# Read size when streaming a JSON array response through ijson
+STREAM_CHUNK_BYTES = 64 * 1024
+
 
 # ============================================================
 # LOAD COMPANIES
@@ -70,15 +167,78 @@ USER_AGENTS = [
 
 
 def load_companies(filepath):
-    """Load companies from JSON file."""
+    """Load companies from JSON file, de-duplicated in file order."""
     try:
-        with open(filepath, "r") as f:
-            companies = set(json.load(f))
+        with open(filepath, "rb") as f:
+            companies = list(dict.fromkeys(load_json(f.read())))
         print(f"Loaded {len(companies):,} companies from {filepath}")
         return companies
     except FileNotFoundError:
         print(f"File not found: {filepath}")
-        return set()
+        return []
+
+
+def load_dead_slugs():
+    """Load the per-platform no-jobs streaks, or {} on the first run."""
+    try:
+        with open(DEAD_SLUGS_FILE, "rb") as f:
+            return load_json(f.read())
+    except FileNotFoundError:
+        return {}
+
+
+def is_dead_slug(entry, today):
+    """Whether a streak entry is long enough to skip the company today."""
+    if entry["misses"] < DEAD_AFTER_RUNS:
+        return False
+    days = (today - date.fromisoformat(entry["last_checked"])).days
+    return days < DEAD_RECHECK_DAYS
+
+
+def skip_dead_slugs(platform, companies, dead_slugs, today):
+    """Drop companies whose no-jobs streak is long enough to skip this run."""
+    streaks = dead_slugs.get(platform, {})
+    live = [
+        slug
+        for slug in companies
+        if slug not in streaks or not is_dead_slug(streaks[slug], today)
+    ]
+    if len(live) < len(companies):
+        print(
+            f"Skipping {len(companies) - len(live):,} {platform} companies "
+            f"with no jobs in the last {DEAD_AFTER_RUNS}+ runs"
+        )
+    return live
+
+
+def update_dead_slugs(
+    platform, companies, fetched, active_companies, failures, dead_slugs, today
+):
+    """Reset the streak of fetched companies that had jobs and extend the
+    streak of those whose board is gone or empty.
+
+    Timeouts, 429s, 5xx and other transient failures leave a streak as it
+    was, as do companies skipped this run, so a failed recheck is retried
+    on the next run. A platform with no active
+    companies at all is left alone, since that points at an outage or block
+    rather than every board going dead.
+    """
+    if not active_companies:
+        return
+    companies = set(companies)
+    streaks = {
+        slug: entry
+        for slug, entry in dead_slugs.get(platform, {}).items()
+        if slug in companies
+    }
+    for slug in fetched:
+        if slug in active_companies:
+            streaks.pop(slug, None)
+        elif slug not in failures or failures[slug] in DEAD_STATUSES:
+            entry = streaks.setdefault(slug, {"since": today.isoformat(), "misses": 0})
+            entry["misses"] = min(entry["misses"] + 1, DEAD_AFTER_RUNS)
+            entry["last_checked"] = today.isoformat()
+    dead_slugs[platform] = streaks
 
 
 # ============================================================
@@ -117,50 +277,259 @@ def get_job_metadata():
     }
 
 
-def fetch_company_jobs_greenhouse(slug):
+@dataclass(slots=True, kw_only=True)
+class Job:
+    """A normalized job posting, in output field order.
+
+    Slotted instances are a fraction of the size of the equivalent dict;
+    jobs are only turned into dicts (to_dict) when the results are saved.
+    """
+
+    company: Any
+    company_slug: Any
+    title: Any
+    location: Any
+    url: Any
+    # Greenhouse-only fields
+    absolute_url: Any = None
+    departments: Optional[list] = None
+    id: Any = None
+    updated_at: Any = None
+    is_recruiter: bool
+    ats: str
+    scraped_at: str
+    source: str
+
+    def to_dict(self):
+        """Return the output dict, leaving out unset Greenhouse-only fields."""
+        job = {
+            "company": self.company,
+            "company_slug": self.company_slug,
+            "title": self.title,
+            "location": self.location,
+            "url": self.url,
+        }
+        for field in ("absolute_url", "departments", "id", "updated_at"):
+            value = getattr(self, field)
+            if value is not None:
+                job[field] = value
+        job["is_recruiter"] = self.is_recruiter
+        job["ats"] = self.ats
+        job["scraped_at"] = self.scraped_at
+        job["source"] = self.source
+        return job
+
+
+def host_semaphore(url):
+    """Return the semaphore capping concurrent requests to the URL's host."""
+    host = urlsplit(url).hostname
+    if host not in HOST_SEMAPHORES:
+        limit = (
+            SHARED_HOST_CONCURRENCY
+            if host in SHARED_HOSTS
+            else MAX_CONNECTIONS_PER_HOST
+        )
+        HOST_SEMAPHORES[host] = asyncio.Semaphore(limit)
+    return HOST_SEMAPHORES[host]
+
+
+class FetchError(Exception):
+    """A request that ended in a non-200 status, after any retries."""
+
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+
+
+async def fetch_json(
+    session,
+    method,
+    url,
+    retries=MAX_RETRIES,
+    decode=None,
+    each=None,
+    cache=None,
+    **kwargs,
+):
+    """Send a request and return the decoded JSON body.
+
+    Raises FetchError with the final status when no 200 arrives; connection
+    errors and timeouts propagate unchanged.
+
+    Requests are capped per host by host_semaphore, and 429/5xx responses
+    are retried with exponential backoff. Bodies too small
+    to contain any jobs come back as an empty dict without being decoded.
+    `decode` overrides the default load_json decoder. For JSON array
+    responses, `each` is applied to every element and the list of results
+    is returned instead (see read_items).
+
+    `cache` is a (platform, slug) key: the request is made conditional on
+    the cached response's validators, and a 304 is answered from disk.
+    """
+    headers = kwargs.pop("headers", {})
+    validators = conditional_headers(cache) if cache is not None else {}
+
+    for attempt in range(retries + 1):
+        async with host_semaphore(url), session.request(
+            method, url, headers={**headers, **validators}, **kwargs
+        ) as response:
+            if response.status == 304 and cache is not None:
+                body = load_cached_body(cache)
+                if body is None:
+                    if not validators:
+                        raise FetchError(response.status)
+                    # The validators outlived their body: drop them, or
+                    # every later run would get the same 304
+                    delete_cache_validators(cache)
+                    break
+                if each is not None:
+                    return list(map(each, iter_items(body)))
+                return (decode or load_json)(body)
+            if response.status == 200:
+                if (
+                    response.content_length is not None
+                    and response.content_length < EMPTY_BODY_BYTES
+                ):
+                    return {}
+                meta = cache_validators(response) if cache is not None else None
+                if each is not None:
+                    chunks = [] if meta else None
+                    data = await read_items(response, each, chunks)
+                    body = b"".join(chunks) if meta else None
+                else:
+                    body = await response.read()
+                    data = (decode or load_json)(body)
+                if meta:
+                    save_cached_response(cache, body, meta)
+                return data
+            if response.status not in RETRY_STATUSES or attempt == retries:
+                raise FetchError(response.status)
+        await asyncio.sleep(RETRY_BACKOFF * 2**attempt)
+
+    # Only reached after a 304 with no cached body; ask again unconditionally
+    return await fetch_json(
+        session, method, url, retries, decode, each, cache, headers=headers, **kwargs
+    )
+
+
+async def read_items(response, each, chunks=None):
+    """Parse a JSON array response element by element, applying `each`.
+
+    With ijson the body is parsed as it arrives, so only one raw element is
+    held at a time rather than the whole body plus the whole decoded array.
+    The raw body is also collected into `chunks` when a list is given.
+    """
+    if ijson is None:
+        body = await response.read()
+        if chunks is not None:
+            chunks.append(body)
+        return list(map(each, iter_items(body)))
+
+    parsed = ijson.sendable_list()
+    coro = ijson.items_coro(parsed, "item", use_float=True)
+    results = []
+    async for chunk in response.content.iter_chunked(STREAM_CHUNK_BYTES):
+        if chunks is not None:
+            chunks.append(chunk)
+        coro.send(chunk)
+        results.extend(map(each, parsed))
+        del parsed[:]
+    coro.close()
+    results.extend(map(each, parsed))
+    return results
+
+
+def iter_items(body):
+    """Iterate over the elements of a JSON array body."""
+    if ijson is not None:
+        return ijson.items(body, "item", use_float=True)
+    data = load_json(body)
+    return data if isinstance(data, list) else []
+
+
+# Fields of the Greenhouse board response that get normalized. With msgspec
+# the response is decoded straight into these, skipping everything else
+# (large fields like job content are never materialized).
+class GreenhouseLocation(TypedDict, total=False):
+    name: Any
+
+
+class GreenhouseDepartment(TypedDict, total=False):
+    name: Any
+
+
+class GreenhouseJob(TypedDict, total=False):
+    title: Any
+    location: Optional[GreenhouseLocation]
+    absolute_url: Any
+    departments: list[GreenhouseDepartment]
+    id: Any
+    updated_at: Any
+
+
+class GreenhouseBoard(TypedDict, total=False):
+    jobs: list[GreenhouseJob]
+
+
+GREENHOUSE_DECODER = (
+    msgspec.json.Decoder(GreenhouseBoard) if msgspec is not None else None
+)
+
+
+def decode_greenhouse_board(data):
+    """Decode a Greenhouse board response, keeping only normalized fields."""
+    if GREENHOUSE_DECODER is not None:
+        return GREENHOUSE_DECODER.decode(data)
+    return load_json(data)
+
+
+async def fetch_company_jobs_greenhouse(session, slug):
     """Fetch all jobs for a company."""
     try:
         url = f"https://boards-api.greenhouse.io/v1/boards/{slug}/jobs"
-        response = requests.get(url, timeout=30)
-
-        if response.status_code == 200:
-            data = response.json()
+        data = await fetch_json(
+            session,
+            "GET",
+            url,
+            decode=decode_greenhouse_board,
+            cache=("greenhouse", slug),
+        )
+
+        if data:
             jobs = data.get("jobs", [])
 
             if jobs:
                 # Normalize job structure for frontend
-                normalized = []
-                for job in jobs:
-                    normalized.append(
-                        {
-                            "company": slug,
-                            "company_slug": slug,
-                            "title": job.get("title"),
-                            "location": job.get("location", {}).get(
-                                "name", "Not specified"
-                            ),
-                            "url": job.get("absolute_url"),
-                            "absolute_url": job.get("absolute_url"),
-                            "departments": [
-                                d.get("name") for d in job.get("departments", [])
-                            ],
-                            "id": job.get("id"),
-                            "updated_at": job.get("updated_at"),
-                            "is_recruiter": is_recruiter_company(slug),
-                            "ats": "Greenhouse",
-                            **get_job_metadata(),
-                        }
+                recruiter_flag = is_recruiter_company(slug)
+                normalized = [
+                    Job(
+                        company=slug,
+                        company_slug=slug,
+                        title=job.get("title"),
+                        location=(job.get("location") or {}).get(
+                            "name", "Not specified"
+                        ),
+                        url=job.get("absolute_url"),
+                        absolute_url=job.get("absolute_url"),
+                        departments=[d.get("name") for d in job.get("departments", [])],
+                        id=job.get("id"),
+                        updated_at=job.get("updated_at"),
+                        is_recruiter=recruiter_flag,
+                        ats="Greenhouse",
+                        **get_job_metadata(),
                     )
+                    for job in jobs
+                ]
 
-                return slug, normalized
+                return slug, normalized, None
 
     except Exception as e:
-        pass
+        return slug, [], e
 
-    return slug, []
+    return slug, [], None
 
 
-def fetch_company_jobs_ashby(slug):
+async def fetch_company_jobs_ashby(session, slug):
     try:
         url = f"https://jobs.ashbyhq.com/api/non-user-graphql?op=ApiJobBoardWithTeams"
         payload = {
@@ -175,34 +544,33 @@ def fetch_company_jobs_ashby(slug):
             "User-Agent": "Mozilla/5.0 (compatible; JobFetcher/1.0)",
         }
 
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        data = await fetch_json(session, "POST", url, json=payload, headers=headers)
 
-        if response.status_code == 200:
-            data = response.json()
+        if data:
             jobs = data.get("data", {}).get("jobBoard", {}).get("jobPostings", [])
 
             if jobs:
-                normalized = []
-                for job in jobs:
-                    normalized.append(
-                        {
-                            "company": slug,
-                            "company_slug": slug,
-                            "title": job.get("title", ""),
-                            "location": job.get("locationName", "Not specified")[:50],
-                            "url": f"https://jobs.ashbyhq.com/{slug}/jobs/{job.get('id')}",
-                            "is_recruiter": is_recruiter_company(slug),
-                            "ats": "Ashby",
-                            **get_job_metadata(),
-                        }
+                recruiter_flag = is_recruiter_company(slug)
+                normalized = [
+                    Job(
+                        company=slug,
+                        company_slug=slug,
+                        title=job.get("title", ""),
+                        location=job.get("locationName", "Not specified")[:50],
+                        url=f"https://jobs.ashbyhq.com/{slug}/jobs/{job.get('id')}",
+                        is_recruiter=recruiter_flag,
+                        ats="Ashby",
+                        **get_job_metadata(),
                     )
-                return slug, normalized
+                    for job in jobs
+                ]
+                return slug, normalized, None
     except Exception as e:
-        pass
-    return slug, []
+        return slug, [], e
+    return slug, [], None
 
 
-def fetch_company_jobs_bamboohr(slug):
+async def fetch_company_jobs_bamboohr(session, slug):
     """https://{slug}.bamboohr.com/careers
     https://{slug}.bamboohr.com/careers/list
 
@@ -210,68 +578,66 @@ def fetch_company_jobs_bamboohr(slug):
 
     try:
         url = f"https://{slug}.bamboohr.com/careers/list"
-        response = requests.get(url, timeout=30)
+        data = await fetch_json(session, "GET", url)
 
-        if response.status_code == 200:
-            data = response.json()
+        if data:
             jobs = data.get("result", [])
 
             if jobs:
-                normalized = []
-                for job in jobs:
-                    normalized.append(
-                        {
-                            "company": slug,
-                            "company_slug": slug,
-                            "title": job.get("jobOpeningName"),
-                            "location": job.get("location", "Not specified")[:50],
-                            "url": f"https://{slug}.bamboohr.com/careers/view/{job.get('id')}",
-                            "is_recruiter": is_recruiter_company(slug),
-                            "ats": "BambooHR",
-                            **get_job_metadata(),
-                        }
+                recruiter_flag = is_recruiter_company(slug)
+                normalized = [
+                    Job(
+                        company=slug,
+                        company_slug=slug,
+                        title=job.get("jobOpeningName"),
+                        location=job.get("location", "Not specified")[:50],
+                        url=f"https://{slug}.bamboohr.com/careers/view/{job.get('id')}",
+                        is_recruiter=recruiter_flag,
+                        ats="BambooHR",
+                        **get_job_metadata(),
                     )
-                return slug, normalized
+                    for job in jobs
+                ]
+                return slug, normalized, None
     except Exception as e:
-        pass
-    return slug, []
+        return slug, [], e
+    return slug, [], None
 
 
-def fetch_company_jobs_lever(slug):
+async def fetch_company_jobs_lever(session, slug):
     """https://api.lever.co/v0/postings/{slug}"""
 
     try:
         url = f"https://api.lever.co/v0/postings/{slug}"
-        response = requests.get(url, timeout=30)
+        recruiter_flag = is_recruiter_company(slug)
+
+        # Postings carry full descriptions, so they are normalized as they
+        # stream in instead of decoding the whole board first
+        def normalize(job):
+            categories = job.get("categories", {})
+            return Job(
+                company=slug,
+                company_slug=slug,
+                title=job.get("text"),
+                location=categories.get("location", "Not specified")[:50],
+                url=job.get("hostedUrl"),
+                is_recruiter=recruiter_flag,
+                ats="Lever",
+                **get_job_metadata(),
+            )
 
-        if response.status_code == 200:
-            jobs = response.json()
+        normalized = await fetch_json(
+            session, "GET", url, each=normalize, cache=("lever", slug)
+        )
 
-            if jobs:
-                normalized = []
-                for job in jobs:
-                    categories = job.get("categories", {})
-                    normalized.append(
-                        {
-                            "company": slug,
-                            "company_slug": slug,
-                            "title": job.get("text"),
-                            "location": categories.get("location", "Not specified")[
-                                :50
-                            ],
-                            "url": job.get("hostedUrl"),
-                            "is_recruiter": is_recruiter_company(slug),
-                            "ats": "Lever",
-                            **get_job_metadata(),
-                        }
-                    )
-                return slug, normalized
+        if normalized:
+            return slug, normalized, None
     except Exception as e:
-        pass
-    return slug, []
+        return slug, [], e
+    return slug, [], None
 
 
-def fetch_company_jobs_workday(slug):
+async def fetch_company_jobs_workday(session, slug):
     """
     slug format: "company|wd#|site_id" e.g. "kohls|wd1|kohlscareers"
     url: https://{company}.wd{num}.myworkdayjobs.com/wday/cxs/{company}/{site_id}/jobs
@@ -280,7 +646,7 @@ def fetch_company_jobs_workday(slug):
     try:
         parts = slug.split("|")
         if len(parts) != 3:
-            return slug, []
+            return slug, [], None
 
         company, wd, site_id = parts
         wd_num = wd.replace("wd", "")
@@ -296,14 +662,14 @@ def fetch_company_jobs_workday(slug):
             "Referer": f"{base_url}/{site_id}",
         }
 
+        recruiter_flag = is_recruiter_company(company)
         normalized = []
-        offset = 0
         limit = 20
         retries = 0
         max_retries = 2
-        observed_total = None
 
-        while True:
+        async def fetch_page(offset):
+            nonlocal retries
             payload = {
                 "appliedFacets": {},
                 "limit": limit,
@@ -311,102 +677,185 @@ def fetch_company_jobs_workday(slug):
                 "searchText": "",
             }
 
-            response = requests.post(
-                api_url,
-                json=payload,
-                headers=headers,
-                timeout=30,
-            )
-
-            if response.status_code != 200:
-                if retries < max_retries:
+            # Workday retries any non-200 itself, with a longer jittered
+            # pause, out of one budget shared by every page of the company
+            while True:
+                try:
+                    return await fetch_json(
+                        session,
+                        "POST",
+                        api_url,
+                        retries=0,
+                        json=payload,
+                        headers=headers,
+                    )
+                except FetchError:
+                    if retries >= max_retries:
+                        raise
                     retries += 1
-                    time.sleep(random.uniform(2.0, 4.0))
-                    continue
-                break
+                await asyncio.sleep(random.uniform(2.0, 4.0))
 
-            data = response.json()
-            jobs = data.get("jobPostings", [])
-            total = data.get("total", 0)
+        async def fetch_later_page(offset):
+            # Jitter between pages (critical)
+            await asyncio.sleep(random.uniform(0.8, 1.8))
+            return await fetch_page(offset)
 
-            # Detect silent blocking / truncation
-            if observed_total is None:
-                observed_total = total
-            elif total != observed_total:
-                # Workday sometimes lies mid-pagination when blocking
-                break
+        def add_page(data):
+            """Normalize a page's postings; False once pagination should stop."""
+            # Detect silent blocking / truncation: Workday sometimes lies
+            # mid-pagination when blocking
+            if not data or data.get("total", 0) != total:
+                return False
 
+            jobs = data.get("jobPostings", [])
             if not jobs:
-                break
-
-            for job in jobs:
-                job_path = job.get("externalPath", "")
-                normalized.append(
-                    {
-                        "company": company,
-                        "company_slug": slug,
-                        "title": job.get("title"),
-                        "location": job.get("locationsText", "Not specified")[:50],
-                        "url": f"{base_url}{job_path}",
-                        "is_recruiter": is_recruiter_company(company),
-                        "ats": "Workday",
-                        **get_job_metadata(),
-                    }
+                return False
+
+            normalized.extend(
+                Job(
+                    company=company,
+                    company_slug=slug,
+                    title=job.get("title"),
+                    location=job.get("locationsText", "Not specified")[:50],
+                    url=f"{base_url}{job.get('externalPath', '')}",
+                    is_recruiter=recruiter_flag,
+                    ats="Workday",
+                    **get_job_metadata(),
                 )
+                for job in jobs
+            )
+            return True
+
+        # The first page gives the total, so every other offset is known and
+        # the rest of the pages can be fetched concurrently
+        first = await fetch_page(0)
+        if not first:
+            return slug, [], None
+        total = first.get("total", 0)
+        if not add_page(first):
+            return slug, normalized, None
+
+        # Later pages go out in waves of MAX_CONNECTIONS_PER_HOST and are read
+        # in offset order, so a failed, empty or changed page (a block) stops
+        # pagination before any further requests are sent. The pages before
+        # it are kept
+        wave_size = limit * MAX_CONNECTIONS_PER_HOST
+        for wave in range(limit, total, wave_size):
+            pages = await asyncio.gather(
+                *(
+                    fetch_later_page(offset)
+                    for offset in range(wave, min(wave + wave_size, total), limit)
+                ),
+                return_exceptions=True,
+            )
+            for data in pages:
+                if isinstance(data, Exception) or not add_page(data):
+                    return slug, normalized, None
 
-            offset += limit
+        return slug, normalized, None
 
-            if offset >= total:
-                break
+    except Exception as e:
+        return slug, [], e
 
-            # Jitter between pages (critical)
-            time.sleep(random.uniform(0.8, 1.8))
 
-        return slug, normalized
+async def fetch_company_jobs_icims(session, slug):
 
-    except Exception:
-        return slug, []
+    # URL: https://careers-{company}.icims.com/jobs/search?ss
 
+    return slug, [], None
 
-def fetch_company_jobs_icims(slug):
 
-    # URL: https://careers-{company}.icims.com/jobs/search?ss
+def failure_reason(error):
+    """The HTTP status of a failed fetch, or the exception's name."""
+    if isinstance(error, FetchError):
+        return error.status
+    return type(error).__name__
 
-    return slug, []
 
+async def fetch_all_jobs(session, platforms):
+    """Fetch jobs from all companies on all platforms in one parallel pass.
 
-def fetch_all_jobs(companies, fetcher, platform="ATS"):
-    """Fetch jobs from all companies in parallel."""
+    `platforms` is a list of (name, companies, fetcher). Returns a dict of
+    name -> (active_companies, jobs, failures), where `failures` maps each
+    company whose fetch failed to the HTTP status or exception name.
+    """
+    total = sum(len(companies) for _, companies, _ in platforms)
     print("=" * 80)
-    print(f"FETCHING JOBS FROM {len(companies):,} COMPANIES FROM PLATFORM: {platform}")
+    print(
+        f"FETCHING JOBS FROM {total:,} COMPANIES FROM PLATFORMS: "
+        + ", ".join(name for name, _, _ in platforms)
+    )
     print("=" * 80 + "\n")
 
-    all_jobs = []
-    active_companies = {}
-    failed = 0
-
-    with ThreadPoolExecutor(max_workers=30) as executor:
-        futures = {executor.submit(fetcher, slug): slug for slug in companies}
-
-        for i, future in enumerate(as_completed(futures), 1):
-            slug, jobs = future.result()
-
-            if jobs:
-                all_jobs.extend(jobs)
-                active_companies[slug] = len(jobs)
-                print(f"  [{i}/{len(companies)}] {slug}: {len(jobs)} jobs")
-            else:
-                failed += 1
-                if i % 50 == 0:
-                    print(f"  [{i}/{len(companies)}] Checked... ({failed} inactive)")
+    results = {name: ({}, [], {}) for name, _, _ in platforms}
+    checked = 0
 
-    print(f"\nDETAILED STATS FOR {platform}:")
-    print(f"  Companies checked: {len(companies)}")
-    print(f"  Companies with jobs: {len(active_companies)}")
-    print(f"  Failed/empty: {failed}")
-    print(f"  Total jobs: {len(all_jobs)}")
+    progress = []
+    last_flush = time.monotonic()
+    done = asyncio.Queue()
 
-    return active_companies, all_jobs
+    # Round-robin across platforms so every platform (and host) is busy from
+    # the start instead of one platform taking all the fetch slots
+    targets = zip_longest(
+        *(
+            [(name, fetcher, slug) for slug in companies]
+            for name, companies, fetcher in platforms
+        )
+    )
+    targets = (target for target in chain.from_iterable(targets) if target)
+
+    # A fixed pool of workers pulls from the shared iterator, so only
+    # MAX_CONCURRENT_FETCHES fetches exist at any time rather than one
+    # coroutine per company created up front
+    async def worker():
+        for name, fetcher, slug in targets:
+            try:
+                _, jobs, error = await fetcher(session, slug)
+            except Exception as e:
+                jobs, error = [], e
+            await done.put((name, slug, jobs, error))
+
+    workers = [asyncio.create_task(worker()) for _ in range(MAX_CONCURRENT_FETCHES)]
+
+    for i in range(1, total + 1):
+        name, slug, jobs, error = await done.get()
+        active_companies, platform_jobs, failures = results[name]
+
+        if jobs:
+            platform_jobs.extend(jobs)
+            active_companies[slug] = len(jobs)
+            progress.append(f"  [{i}/{total}] {name} {slug}: {len(jobs)} jobs")
+        else:
+            if error is not None:
+                failures[slug] = failure_reason(error)
+            checked += 1
+            if i % 50 == 0:
+                progress.append(f"  [{i}/{total}] Checked... ({checked} inactive)")
+
+        if (
+            len(progress) >= PROGRESS_BATCH
+            or time.monotonic() - last_flush >= PROGRESS_INTERVAL
+        ):
+            flush_progress(progress)
+            last_flush = time.monotonic()
+
+    flush_progress(progress)
+    await asyncio.gather(*workers)
+
+    for name, companies, _ in platforms:
+        active_companies, platform_jobs, failures = results[name]
+        empty = len(companies) - len(active_companies) - len(failures)
+        print(f"\nDETAILED STATS FOR {name}:")
+        print(f"  Companies checked: {len(companies)}")
+        print(f"  Companies with jobs: {len(active_companies)}")
+        print(f"  Empty boards: {empty}")
+        print(f"  Failed fetches: {len(failures)}")
+        if failures:
+            reasons = Counter(failures.values()).most_common(5)
+            print("    " + ", ".join(f"{reason}: {n}" for reason, n in reasons))
+        print(f"  Total jobs: {len(platform_jobs)}")
+
+    return results
 
 
 # ============================================================
@@ -414,25 +863,123 @@ def fetch_all_jobs(companies, fetcher, platform="ATS"):
 # ============================================================
 
 
-def is_recruiter_company(slug):
-    slug = slug.lower()
+def cache_paths(cache):
+    """Return the (body, meta) file paths for a (platform, slug) cache key."""
+    platform, slug = cache
+    base = os.path.join(CACHE_DIR, platform, slug)
+    return f"{base}.json", f"{base}.meta.json"
+
+
+def conditional_headers(cache):
+    """Return If-None-Match/If-Modified-Since headers for a cached response."""
+    try:
+        with open(cache_paths(cache)[1], "rb") as f:
+            meta = load_json(f.read())
+    except (OSError, ValueError):
+        return {}
+
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def cache_validators(response):
+    """Return the response's ETag/Last-Modified, or None if it has neither."""
+    meta = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    return meta if any(meta.values()) else None
+
+
+def load_cached_body(cache):
+    """Return the cached response body, or None if it is missing."""
+    try:
+        with open(cache_paths(cache)[0], "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def delete_cache_validators(cache):
+    """Remove a cached response's validators, so the next request for it is
+    unconditional."""
+    try:
+        os.remove(cache_paths(cache)[1])
+    except FileNotFoundError:
+        pass
+
 
-    # Keyword-based detection
-    if any(term in slug for term in RECRUITER_TERMS):
-        return True
+def save_cached_response(cache, body, meta):
+    """Store a response body and its validators (meta last, so it is only
+    present once the body is complete)."""
+    body_path, meta_path = cache_paths(cache)
+    os.makedirs(os.path.dirname(body_path), exist_ok=True)
+    atomic_write(body_path, body)
+    atomic_write(meta_path, dump_json(meta))
 
-    return False
+
+def atomic_write(path, data):
+    """Write bytes to a temp file and rename it over `path`, so readers (and a
+    run cut short) never see a half-written file."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def flush_progress(lines):
+    """Write buffered progress lines to stdout in one call and clear them."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
+
+
+def load_json(data):
+    """Decode JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json(obj, indent=False, sort_keys=False):
+    """Encode an object to JSON bytes, using orjson when it is installed.
+
+    Output is compact unless `indent` is set.
+    """
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (
+            orjson.OPT_SORT_KEYS if sort_keys else 0
+        )
+        return orjson.dumps(obj, option=option)
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        sort_keys=sort_keys,
+    ).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def is_recruiter_company(slug):
+    # Keyword-based detection; cached since it only depends on the slug
+    return RECRUITER_RE.search(slug) is not None
 
 
 def clean_job_data(jobs):
     """Remove invalid/useless job entries."""
     cleaned = []
-    skipped_reasons = {"no_title": 0, "no_url": 0, "no_company": 0}
+    seen = set()
+    skipped_reasons = {"no_title": 0, "no_url": 0, "no_company": 0, "duplicate": 0}
 
     for job in jobs:
-        title = (job.get("title") or "").strip().lower()
-        url = job.get("url") or job.get("absolute_url")
-        company = job.get("company") or job.get("company_slug")
+        title = (job.title or "").strip().lower()
+        url = job.url or job.absolute_url
+        company = job.company or job.company_slug
 
         # Skip jobs with invalid titles
         if not title or title in ["not specified", "n/a", "unknown", ""]:
@@ -449,12 +996,19 @@ def clean_job_data(jobs):
             skipped_reasons["no_company"] += 1
             continue
 
+        # Skip repeats of a posting (e.g. Workday pagination overlap)
+        key = (job.company_slug, url)
+        if key in seen:
+            skipped_reasons["duplicate"] += 1
+            continue
+        seen.add(key)
+
         cleaned.append(job)
 
     # Print summary
     total_skipped = sum(skipped_reasons.values())
     if total_skipped > 0:
-        print(f"\n  Skipped {total_skipped:,} invalid jobs:")
+        print(f"\n  Skipped {total_skipped:,} invalid or duplicate jobs:")
         for reason, count in skipped_reasons.items():
             if count > 0:
                 print(f"    - {reason.replace('_', ' ').title()}: {count:,}")
@@ -467,6 +1021,39 @@ def clean_job_data(jobs):
 # ============================================================
 
 
+def save_parquet(path, jobs):
+    """Save jobs as zstd-compressed Parquet with dictionary-encoded strings."""
+    # Explicit schema: jobs from different ATS have different keys, and
+    # pyarrow would otherwise infer the columns from the first job only
+    schema = pa.schema(
+        [
+            ("company", pa.string()),
+            ("company_slug", pa.string()),
+            ("title", pa.string()),
+            ("location", pa.string()),
+            ("url", pa.string()),
+            ("absolute_url", pa.string()),
+            ("departments", pa.list_(pa.string())),
+            ("id", pa.int64()),
+            ("updated_at", pa.string()),
+            ("is_recruiter", pa.bool_()),
+            ("ats", pa.string()),
+            ("scraped_at", pa.string()),
+            ("source", pa.string()),
+        ]
+    )
+    try:
+        table = pa.Table.from_pylist(jobs, schema=schema)
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        print(f"Skipped Parquet output: {e}")
+        return
+    buffer = pa.BufferOutputStream()
+    pq.write_table(table, buffer, compression="zstd", use_dictionary=True)
+    data = buffer.getvalue()
+    atomic_write(path, data)
+    print(f"Parquet: {path} ({data.size / (1024 * 1024):.1f}MB)")
+
+
 def save_results(all_companies, active_companies, all_jobs):
     """Save all data to JSON files."""
     print("=" * 80)
@@ -474,41 +1061,52 @@ def save_results(all_companies, active_companies, all_jobs):
     print("=" * 80 + "\n")
 
     original_count = len(all_jobs)
-    all_jobs = clean_job_data(all_jobs)
+    all_jobs = [job.to_dict() for job in clean_job_data(all_jobs)]
     cleaned_count = original_count - len(all_jobs)
-    print(f"Removed {cleaned_count:,} invalid jobs (blank/not specified titles)")
+    print(f"Removed {cleaned_count:,} invalid or duplicate jobs")
 
     timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
-    # Save all companies list
-    companies_file = os.path.join(OUTPUT_DIR, "all_companies.json")
-    with open(companies_file, "w") as f:
-        json.dump(sorted(list(all_companies)), f, indent=2)
-    print(f"All companies: {companies_file}")
-
-    # Save active companies with job counts
-    active_file = os.path.join(OUTPUT_DIR, "active_companies.json")
-    with open(active_file, "w") as f:
-        json.dump(active_companies, f, indent=2, sort_keys=True)
-    print(f"Active companies: {active_file}")
-
-    # Save all jobs
-    all_jobs_file = os.path.join(OUTPUT_DIR, "all_jobs.json")
-    with open(all_jobs_file, "w") as f:
-        json.dump(all_jobs, f, indent=2)
-    print(f"All jobs: {all_jobs_file} ({len(all_jobs):,} jobs)")
-
-    # Save compressed version for GitHub Pages
-    compressed_file = os.path.join(OUTPUT_DIR, "all_jobs.json.gz")
-    with gzip.open(compressed_file, "wt", encoding="utf-8") as f:
-        json.dump(all_jobs, f)
-
-    # Check compression ratio
-    original_size = os.path.getsize(all_jobs_file) / (1024 * 1024)
-    compressed_size = os.path.getsize(compressed_file) / (1024 * 1024)
-    print(
-        f"Compressed: {compressed_file} ({compressed_size:.1f}MB, {compressed_size/original_size*100:.1f}% of original)"
-    )
+    # Serialize all jobs once for both the plain and compressed copies. The
+    # gzip and Parquet encoding run on worker threads (zlib and pyarrow
+    # release the GIL) while the other files are written.
+    payload = dump_json(all_jobs)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        compressing = executor.submit(gzip.compress, payload, compresslevel=1)
+        if pq is not None:
+            # Save columnar copy for analysis tools (requires pyarrow)
+            parquet_file = os.path.join(OUTPUT_DIR, "all_jobs.parquet")
+            writing_parquet = executor.submit(save_parquet, parquet_file, all_jobs)
+
+        # Save all companies list
+        companies_file = os.path.join(OUTPUT_DIR, "all_companies.json")
+        atomic_write(companies_file, dump_json(sorted(all_companies)))
+        print(f"All companies: {companies_file}")
+
+        # Save active companies with job counts
+        active_file = os.path.join(OUTPUT_DIR, "active_companies.json")
+        atomic_write(active_file, dump_json(active_companies, sort_keys=True))
+        print(f"Active companies: {active_file}")
+
+        # Save all jobs
+        all_jobs_file = os.path.join(OUTPUT_DIR, "all_jobs.json")
+        atomic_write(all_jobs_file, payload)
+        print(f"All jobs: {all_jobs_file} ({len(all_jobs):,} jobs)")
+
+        # Save compressed version for GitHub Pages
+        compressed_file = os.path.join(OUTPUT_DIR, "all_jobs.json.gz")
+        compressed = compressing.result()
+        atomic_write(compressed_file, compressed)
+
+        # Check compression ratio
+        original_size = len(payload) / (1024 * 1024)
+        compressed_size = len(compressed) / (1024 * 1024)
+        print(
+            f"Compressed: {compressed_file} ({compressed_size:.1f}MB, {compressed_size/original_size*100:.1f}% of original)"
+        )
+
+        if pq is not None:
+            writing_parquet.result()
 
     recruiter_jobs = sum(1 for job in all_jobs if job.get("is_recruiter"))
 
@@ -524,19 +1122,24 @@ def save_results(all_companies, active_companies, all_jobs):
     }
 
     metadata_file = os.path.join(OUTPUT_DIR, "metadata.json")
-    with open(metadata_file, "w") as f:
-        json.dump(metadata, f, indent=2)
+    atomic_write(metadata_file, dump_json(metadata, indent=True))
     print(f"Metadata: {metadata_file}")
 
     print()
 
 
+def save_dead_slugs(dead_slugs):
+    """Save the no-jobs streaks, indented so the daily commit diffs well."""
+    atomic_write(DEAD_SLUGS_FILE, dump_json(dead_slugs, indent=True, sort_keys=True))
+    print(f"Dead slugs: {DEAD_SLUGS_FILE}")
+
+
 # ============================================================
 # MAIN
 # ============================================================
 
 
-def main():
+async def main():
     print("\n" + "=" * 80)
     print("JOB BOARD AGGREGATOR")
     print("Scraping all jobs from ATS companies")
@@ -559,46 +1162,53 @@ def main():
         print("Exiting - no companies loaded!")
         return
 
-    # Fetch from all sources
-    active_greenhouse, jobs_greenhouse = fetch_all_jobs(
-        greenhouse_companies, fetch_company_jobs_greenhouse, "GREENHOUSE"
-    )
-    active_ashby, jobs_ashby = fetch_all_jobs(
-        ashby_companies, fetch_company_jobs_ashby, "ASHBY"
-    )
-
-    (
-        active_bamboohy,
-        jobs_bamboohr,
-    ) = fetch_all_jobs(bamboohr_companies, fetch_company_jobs_bamboohr, "BAMBOOHR")
-
-    active_lever, jobs_lever = fetch_all_jobs(
-        lever_companies, fetch_company_jobs_lever, "LEVER"
-    )
-
-    active_workday, jobs_workday = fetch_all_jobs(
-        workday_companies, fetch_company_jobs_workday, "WORKDAY"
+    platforms = [
+        ("GREENHOUSE", greenhouse_companies, fetch_company_jobs_greenhouse),
+        ("ASHBY", ashby_companies, fetch_company_jobs_ashby),
+        ("BAMBOOHR", bamboohr_companies, fetch_company_jobs_bamboohr),
+        ("LEVER", lever_companies, fetch_company_jobs_lever),
+        ("WORKDAY", workday_companies, fetch_company_jobs_workday),
+    ]
+
+    # Leave out companies that have been dead for several runs
+    dead_slugs = load_dead_slugs()
+    today = datetime.now(timezone.utc).date()
+    to_fetch = [
+        (name, skip_dead_slugs(name, companies, dead_slugs, today), fetcher)
+        for name, companies, fetcher in platforms
+    ]
+
+    # Fetch from all sources over one pooled, kept-alive session
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONNECTIONS,
+        # Per-host caps are enforced by host_semaphore; this only has to
+        # leave room for the largest of them
+        limit_per_host=SHARED_HOST_CONCURRENCY,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
     )
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=REQUEST_TIMEOUT
+    ) as session:
+        results = await fetch_all_jobs(session, to_fetch)
 
     # Combine results
-    all_companies = (
-        greenhouse_companies
-        | ashby_companies
-        | bamboohr_companies
-        | lever_companies
-        | workday_companies
-    )
-    all_active_companies = {
-        **active_greenhouse,
-        **active_ashby,
-        **active_bamboohy,
-        **active_lever,
-        **active_workday,
-    }
-    all_jobs = jobs_greenhouse + jobs_ashby + jobs_bamboohr + jobs_lever + jobs_workday
+    all_companies = set().union(*(companies for _, companies, _ in platforms))
+    all_active_companies = {}
+    all_jobs = []
+    for active_companies, jobs, _ in results.values():
+        all_active_companies.update(active_companies)
+        all_jobs.extend(jobs)
 
     save_results(all_companies, all_active_companies, all_jobs)
 
+    for (name, companies, _), (_, fetched, _) in zip(platforms, to_fetch):
+        active_companies, _, failures = results[name]
+        update_dead_slugs(
+            name, companies, fetched, active_companies, failures, dead_slugs, today
+        )
+    save_dead_slugs(dead_slugs)
+
     # Final summary
     print("=" * 80)
     print("FINAL SUMMARY")
@@ -624,4 +1234,9 @@ if __name__ == "__main__":
 
     print(f"\nRunning in {SOURCE_TYPE.upper()} mode\n")
 
-    main()
+    # libuv-based event loop when available; it handles the fan-out's
+    # thousands of sockets with less per-event overhead than asyncio's own
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())